@@ -16,130 +16,389 @@ Requirements:
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
 import json
 import logging
+import math
 import os
+import posixpath
+import shlex
+import socket
 import subprocess
 import sys
+import tempfile
 import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 try:
-    import boto3
-    from botocore.exceptions import ClientError, BotoCoreError
+    import orjson
 except ImportError:
-    print("ERROR: boto3 is required. Install with: pip install boto3")
-    sys.exit(1)
+    orjson = None
+
+# boto3, openstacksdk and the SSH libraries are imported on first use so that
+# --help and argument validation do not pay for loading them
+boto3 = None
+openstack = None
+paramiko = None
+asyncssh = None
+
+
+def _require_boto3() -> None:
+    """Import boto3 and the botocore helpers, raising ImportError with an install hint if missing."""
+    global boto3, TransferConfig, BotoConfig, ClientError, BotoCoreError, WaiterError
+    global WaiterModel, create_waiter_with_client
+    if boto3 is not None:
+        return
+    try:
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config as BotoConfig
+        from botocore.exceptions import ClientError, BotoCoreError, WaiterError
+        from botocore.waiter import WaiterModel, create_waiter_with_client
+    except ImportError as e:
+        raise ImportError("boto3 is required. Install with: pip install boto3") from e
+
+
+def _require_openstack() -> None:
+    """Import openstacksdk, raising ImportError with an install hint if missing."""
+    global openstack, os_exceptions
+    if openstack is not None:
+        return
+    try:
+        import openstack
+        from openstack import exceptions as os_exceptions
+    except ImportError as e:
+        raise ImportError("openstacksdk is required. Install with: pip install openstacksdk") from e
 
-try:
-    import openstack
-    from openstack import exceptions as os_exceptions
-except ImportError:
-    print("ERROR: openstacksdk is required. Install with: pip install openstacksdk")
-    sys.exit(1)
 
-try:
-    import paramiko
-except ImportError:
-    print("ERROR: paramiko is required. Install with: pip install paramiko")
-    sys.exit(1)
+def _require_paramiko() -> None:
+    """Import paramiko, raising ImportError with an install hint if missing."""
+    global paramiko
+    if paramiko is not None:
+        return
+    try:
+        import paramiko
+    except ImportError as e:
+        raise ImportError("paramiko is required. Install with: pip install paramiko") from e
+
+
+def _asyncssh_available() -> bool:
+    """Import asyncssh if it is installed and report whether it is usable."""
+    global asyncssh
+    if asyncssh is None:
+        try:
+            import asyncssh
+        except ImportError:
+            return False
+    return True
+
 
 LOG = logging.getLogger("ec2_to_openstack_migration")
 
+# Paramiko's defaults (64 KiB window, 32 KiB requests) cap throughput on WAN links
+SSH_SOCKET_BUFFER_SIZE = 32 * 1024 * 1024
+SSH_WINDOW_SIZE = 134217727
+SFTP_BLOCK_SIZE = 8 * 1024 * 1024
+
+# asyncssh tuning: 15x its 16 KiB default block with many requests in flight
+ASYNCSSH_BLOCK_SIZE = 15 * 16 * 1024
+ASYNCSSH_MAX_REQUESTS = 128
+ASYNCSSH_MAX_PARALLEL_FILES = 16
+
+# How long describe_* responses cached under <output-dir>/.cache stay valid (seconds)
+DESCRIBE_CACHE_TTL = 3600
+
+# EC2 accepts at most 200 values per describe_* filter
+EC2_FILTER_MAX_VALUES = 200
+
+# (vCPUs, memory in MiB) for common EC2 instance types, used to pick a flavor
+AWS_INSTANCE_SPECS = {
+    "t2.nano": (1, 512),
+    "t2.micro": (1, 1024),
+    "t2.small": (1, 2048),
+    "t2.medium": (2, 4096),
+    "t2.large": (2, 8192),
+    "t2.xlarge": (4, 16384),
+    "t2.2xlarge": (8, 32768),
+    "t3.nano": (2, 512),
+    "t3.micro": (2, 1024),
+    "t3.small": (2, 2048),
+    "t3.medium": (2, 4096),
+    "t3.large": (2, 8192),
+    "t3.xlarge": (4, 16384),
+    "t3.2xlarge": (8, 32768),
+    "m5.large": (2, 8192),
+    "m5.xlarge": (4, 16384),
+    "m5.2xlarge": (8, 32768),
+    "m5.4xlarge": (16, 65536),
+    "c5.large": (2, 4096),
+    "c5.xlarge": (4, 8192),
+    "c5.2xlarge": (8, 16384),
+    "c5.4xlarge": (16, 32768),
+    "r5.large": (2, 16384),
+    "r5.xlarge": (4, 32768),
+    "r5.2xlarge": (8, 65536),
+}
+
+# boto3 ships no waiter for export image tasks, so define one
+EXPORT_IMAGE_WAITER_MODEL = {
+    "version": 2,
+    "waiters": {
+        "ExportImageTaskCompleted": {
+            "delay": 30,
+            "maxAttempts": 120,
+            "operation": "DescribeExportImageTasks",
+            "acceptors": [
+                {
+                    "matcher": "pathAll",
+                    "expected": "completed",
+                    "argument": "ExportImageTasks[].Status",
+                    "state": "success",
+                },
+                {
+                    "matcher": "pathAny",
+                    "expected": "deleting",
+                    "argument": "ExportImageTasks[].Status",
+                    "state": "failure",
+                },
+                {
+                    "matcher": "pathAny",
+                    "expected": "deleted",
+                    "argument": "ExportImageTasks[].Status",
+                    "state": "failure",
+                },
+                # Keep polling through throttling instead of aborting a long export
+                {
+                    "matcher": "error",
+                    "expected": "RequestLimitExceeded",
+                    "state": "retry",
+                },
+                {
+                    "matcher": "error",
+                    "expected": "Throttling",
+                    "state": "retry",
+                },
+            ],
+        }
+    },
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _boto_session(profile: Optional[str] = None) -> "boto3.Session":
+    """Return a shared boto3 session per profile so credentials are resolved once."""
+    _require_boto3()
+    return boto3.Session(profile_name=profile) if profile else boto3.Session()
+
+
+@functools.lru_cache(maxsize=16)
+def _boto_client(
+    service: str,
+    region: Optional[str] = None,
+    profile: Optional[str] = None,
+    endpoint_url: Optional[str] = None,
+) -> Any:
+    """Return a shared boto3 client with a larger connection pool and adaptive retries."""
+    _require_boto3()
+    config = BotoConfig(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={"max_attempts": 10, "mode": "adaptive"},
+        connect_timeout=10,
+        read_timeout=30,
+    )
+    return _boto_session(profile).client(
+        service, region_name=region, endpoint_url=endpoint_url, config=config
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _os_connection(cloud_name: Optional[str] = None) -> "openstack.connection.Connection":
+    """Return a shared OpenStack connection per cloud so the Keystone token is reused."""
+    _require_openstack()
+    return openstack.connect(cloud=cloud_name) if cloud_name else openstack.connect()
+
 
+@dataclass(slots=True)
 class EC2InstanceInfo:
     """Container for EC2 instance information."""
 
-    def __init__(self, instance_data: Dict[str, Any]):
-        self.instance_id = instance_data["InstanceId"]
-        self.instance_type = instance_data["InstanceType"]
-        self.image_id = instance_data["ImageId"]
-        self.key_name = instance_data.get("KeyName")
-        self.private_ip = instance_data.get("PrivateIpAddress")
-        self.public_ip = instance_data.get("PublicIpAddress")
-        self.state = instance_data["State"]["Name"]
-        self.architecture = instance_data.get("Architecture", "x86_64")
-        self.platform = instance_data.get("Platform", "linux")
-        self.volumes = []
-        self.security_groups = [
-            sg["GroupId"] for sg in instance_data.get("SecurityGroups", [])
-        ]
-        self.tags = {tag["Key"]: tag["Value"] for tag in instance_data.get("Tags", [])}
-        self.name = self.tags.get("Name", self.instance_id)
+    instance_id: str
+    instance_type: str
+    image_id: str
+    key_name: Optional[str]
+    private_ip: Optional[str]
+    public_ip: Optional[str]
+    state: str
+    architecture: str
+    platform: str
+    volumes: List[Dict[str, Any]] = field(default_factory=list)
+    security_groups: List[str] = field(default_factory=list)
+    tags: Dict[str, str] = field(default_factory=dict)
+    name: str = ""
+
+    @classmethod
+    def from_aws(cls, instance_data: Dict[str, Any]) -> "EC2InstanceInfo":
+        """Build from a describe_instances instance entry."""
+        tags = {tag["Key"]: tag["Value"] for tag in instance_data.get("Tags", [])}
+        return cls(
+            instance_id=instance_data["InstanceId"],
+            instance_type=instance_data["InstanceType"],
+            image_id=instance_data["ImageId"],
+            key_name=instance_data.get("KeyName"),
+            private_ip=instance_data.get("PrivateIpAddress"),
+            public_ip=instance_data.get("PublicIpAddress"),
+            state=instance_data["State"]["Name"],
+            architecture=instance_data.get("Architecture", "x86_64"),
+            platform=instance_data.get("Platform", "linux"),
+            security_groups=[
+                sg["GroupId"] for sg in instance_data.get("SecurityGroups", [])
+            ],
+            tags=tags,
+            name=tags.get("Name", instance_data["InstanceId"]),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "instance_id": self.instance_id,
-            "instance_type": self.instance_type,
-            "image_id": self.image_id,
-            "key_name": self.key_name,
-            "private_ip": self.private_ip,
-            "public_ip": self.public_ip,
-            "state": self.state,
-            "architecture": self.architecture,
-            "platform": self.platform,
-            "volumes": self.volumes,
-            "security_groups": self.security_groups,
-            "tags": self.tags,
-            "name": self.name,
-        }
+        return asdict(self)
 
 
 class EC2Migrator:
     """Handles AWS EC2 operations for migration."""
 
-    def __init__(self, region: str = "us-east-1", profile: Optional[str] = None):
+    def __init__(
+        self,
+        region: str = "us-east-1",
+        profile: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+    ):
         """Initialize AWS clients."""
-        session = boto3.Session(profile_name=profile) if profile else boto3.Session()
-        self.ec2 = session.client("ec2", region_name=region)
+        self.ec2 = _boto_client("ec2", region, profile)
+        self.s3 = _boto_client("s3", region, profile)
         self.region = region
+        self.profile = profile
+        self.cache_dir = cache_dir
+        self._instances: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
         LOG.info(f"Initialized AWS client for region: {region}")
 
-    def get_instance(self, instance_id: str) -> EC2InstanceInfo:
-        """Get EC2 instance details."""
+    def _cached_describe(
+        self,
+        kind: str,
+        instance_ids: Tuple[str, ...],
+        fetch: Callable[[], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Return fetch(), reusing a JSON copy saved under cache_dir by an earlier run.
+        Lets a retried migration skip the describe calls for DESCRIBE_CACHE_TTL seconds.
+        """
+        if self.cache_dir is None:
+            return fetch()
+
+        # Same IDs under another profile may belong to another account, so it is part of the key
+        profile = self.profile or os.environ.get("AWS_PROFILE", "default")
+        key = f"{profile}:{','.join(sorted(instance_ids))}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        cache_file = self.cache_dir / f"{kind}-{self.region}-{digest}.json"
         try:
-            response = self.ec2.describe_instances(InstanceIds=[instance_id])
-            if not response["Reservations"]:
-                raise ValueError(f"Instance {instance_id} not found")
-
-            instance_data = response["Reservations"][0]["Instances"][0]
-            instance_info = EC2InstanceInfo(instance_data)
-
-            # Get volume information
-            volume_ids = [
-                bdm["Ebs"]["VolumeId"]
-                for bdm in instance_data.get("BlockDeviceMappings", [])
-                if "Ebs" in bdm
-            ]
-
-            if volume_ids:
-                volumes_response = self.ec2.describe_volumes(VolumeIds=volume_ids)
-                instance_info.volumes = [
-                    {
-                        "volume_id": vol["VolumeId"],
-                        "size": vol["Size"],
-                        "device": next(
-                            (
-                                bdm["DeviceName"]
-                                for bdm in instance_data.get("BlockDeviceMappings", [])
-                                if bdm.get("Ebs", {}).get("VolumeId") == vol["VolumeId"]
-                            ),
-                            None,
-                        ),
-                        "volume_type": vol["VolumeType"],
-                        "encrypted": vol.get("Encrypted", False),
-                    }
-                    for vol in volumes_response["Volumes"]
-                ]
-
-            return instance_info
+            if time.time() - cache_file.stat().st_mtime < DESCRIBE_CACHE_TTL:
+                LOG.debug(f"Using cached {kind} from {cache_file}")
+                return json.loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+        result = fetch()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(_dump_json(result))
+        return result
+
+    def _describe_instances(self, instance_ids: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """Describe instances with paginated batch calls, cached for the duration of the run."""
+        if instance_ids in self._instances:
+            return self._instances[instance_ids]
+
+        def fetch() -> List[Dict[str, Any]]:
+            # A filter (unlike InstanceIds) paginates, so no single request grows with the fleet
+            paginator = self.ec2.get_paginator("describe_instances")
+            instances = []
+            for start in range(0, len(instance_ids), EC2_FILTER_MAX_VALUES):
+                batch = list(instance_ids[start : start + EC2_FILTER_MAX_VALUES])
+                for page in paginator.paginate(
+                    Filters=[{"Name": "instance-id", "Values": batch}]
+                ):
+                    for reservation in page["Reservations"]:
+                        instances.extend(reservation["Instances"])
+            return instances
+
+        instances = self._cached_describe("instances", instance_ids, fetch)
+        self._instances[instance_ids] = instances
+        return instances
+
+    def _describe_attached_volumes(self, instance_ids: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """Describe all volumes attached to the given instances."""
+
+        def fetch() -> List[Dict[str, Any]]:
+            paginator = self.ec2.get_paginator("describe_volumes")
+            volumes = []
+            for start in range(0, len(instance_ids), EC2_FILTER_MAX_VALUES):
+                batch = list(instance_ids[start : start + EC2_FILTER_MAX_VALUES])
+                for page in paginator.paginate(
+                    Filters=[{"Name": "attachment.instance-id", "Values": batch}]
+                ):
+                    volumes.extend(page["Volumes"])
+            return volumes
+
+        return self._cached_describe("volumes", instance_ids, fetch)
+
+    def get_instances(self, instance_ids: List[str]) -> List[EC2InstanceInfo]:
+        """Get details for several EC2 instances with batched API calls."""
+        ids = tuple(instance_ids)
+        try:
+            # Filtering volumes by attachment lets both calls run concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                instances_future = executor.submit(self._describe_instances, ids)
+                volumes_future = executor.submit(self._describe_attached_volumes, ids)
+                instances = {i["InstanceId"]: i for i in instances_future.result()}
+                volumes = {v["VolumeId"]: v for v in volumes_future.result()}
+
+            results = []
+            for instance_id in ids:
+                instance_data = instances.get(instance_id)
+                if instance_data is None:
+                    raise ValueError(f"Instance {instance_id} not found")
+
+                instance_info = EC2InstanceInfo.from_aws(instance_data)
+                for bdm in instance_data.get("BlockDeviceMappings", []):
+                    vol = volumes.get(bdm.get("Ebs", {}).get("VolumeId"))
+                    if vol is None:
+                        continue
+                    instance_info.volumes.append(
+                        {
+                            "volume_id": vol["VolumeId"],
+                            "size": vol["Size"],
+                            "device": bdm["DeviceName"],
+                            "volume_type": vol["VolumeType"],
+                            "encrypted": vol.get("Encrypted", False),
+                        }
+                    )
+                results.append(instance_info)
+
+            return results
         except ClientError as e:
-            LOG.error(f"Failed to get instance {instance_id}: {e}")
+            LOG.error(f"Failed to get instances {', '.join(ids)}: {e}")
             raise
 
+    def get_instance(self, instance_id: str) -> EC2InstanceInfo:
+        """Get EC2 instance details."""
+        return self.get_instances([instance_id])[0]
+
     def create_ami(
         self, instance_id: str, name: str, description: Optional[str] = None
     ) -> str:
@@ -169,8 +428,22 @@ class EC2Migrator:
             LOG.error(f"Failed to create AMI: {e}")
             raise
 
+    async def async_create_ami(
+        self, instance_id: str, name: str, description: Optional[str] = None
+    ) -> str:
+        """Run create_ami on a worker thread so several AMIs can be created concurrently."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.create_ami, instance_id, name, description)
+        )
+
     def export_ami_to_s3(
-        self, ami_id: str, s3_bucket: str, s3_prefix: str = "ami-exports"
+        self,
+        ami_id: str,
+        s3_bucket: str,
+        s3_prefix: str = "ami-exports/",
+        poll_delay: int = 30,
+        timeout: int = 43200,
     ) -> Dict[str, Any]:
         """
         Export AMI to S3 as a disk image.
@@ -192,22 +465,39 @@ class EC2Migrator:
             LOG.info(f"Export task started: {export_task_id}")
 
             # Wait for export to complete
-            while True:
-                task = self.ec2.describe_export_image_tasks(
-                    ExportImageTaskIds=[export_task_id]
-                )["ExportImageTasks"][0]
-                status = task["Status"]
-                if status == "completed":
-                    LOG.info("AMI export completed successfully")
-                    return {
-                        "task_id": export_task_id,
-                        "s3_location": task["S3ExportLocation"],
-                        "status": status,
-                    }
-                elif status == "deleting" or status == "deleted":
-                    raise RuntimeError(f"Export failed with status: {status}")
-                LOG.info(f"Export status: {status}, waiting...")
-                time.sleep(30)
+            LOG.info("Waiting for AMI export to complete (this may take a long time)...")
+            waiter = create_waiter_with_client(
+                "ExportImageTaskCompleted",
+                WaiterModel(EXPORT_IMAGE_WAITER_MODEL),
+                self.ec2,
+            )
+            max_attempts = max(1, math.ceil(timeout / poll_delay))
+            try:
+                waiter.wait(
+                    ExportImageTaskIds=[export_task_id],
+                    WaiterConfig={"Delay": poll_delay, "MaxAttempts": max_attempts},
+                )
+            except WaiterError as e:
+                tasks = (e.last_response or {}).get("ExportImageTasks") or [{}]
+                status = tasks[0].get("Status")
+                if status in ("deleting", "deleted"):
+                    raise RuntimeError(f"Export failed with status: {status}") from e
+                if "Max attempts exceeded" in str(e):
+                    raise TimeoutError(
+                        f"Export task {export_task_id} still {status} after {timeout}s "
+                        "(max attempts exceeded)"
+                    ) from e
+                raise RuntimeError(f"Export waiter failed: {e}") from e
+
+            task = self.ec2.describe_export_image_tasks(
+                ExportImageTaskIds=[export_task_id]
+            )["ExportImageTasks"][0]
+            LOG.info("AMI export completed successfully")
+            return {
+                "task_id": export_task_id,
+                "s3_location": task["S3ExportLocation"],
+                "status": task["Status"],
+            }
         except ClientError as e:
             if e.response["Error"]["Code"] == "InvalidParameter":
                 LOG.warning(
@@ -218,6 +508,39 @@ class EC2Migrator:
             LOG.error(f"Failed to export AMI: {e}")
             raise
 
+    async def async_export_ami_to_s3(
+        self,
+        ami_id: str,
+        s3_bucket: str,
+        s3_prefix: str = "ami-exports/",
+        poll_delay: int = 30,
+        timeout: int = 43200,
+    ) -> Dict[str, Any]:
+        """Run export_ami_to_s3 on a worker thread so several exports can run concurrently."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.export_ami_to_s3, ami_id, s3_bucket, s3_prefix, poll_delay, timeout
+            ),
+        )
+
+    @staticmethod
+    def get_export_location(export_info: Dict[str, Any]) -> Tuple[str, str]:
+        """Return the (bucket, key) of the disk image written by an export task."""
+        location = export_info["s3_location"]
+        key = f"{location.get('S3Prefix', '')}{export_info['task_id']}.raw"
+        return location["S3Bucket"], key
+
+    def get_export_url(self, export_info: Dict[str, Any], expires_in: int = 21600) -> str:
+        """Return a presigned URL for the disk image written by an export task."""
+        bucket, key = self.get_export_location(export_info)
+        return self.s3.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket, "Key": key},
+            ExpiresIn=expires_in,
+        )
+
 
 class OpenStackMigrator:
     """Handles OpenStack operations for migration."""
@@ -225,30 +548,65 @@ class OpenStackMigrator:
     def __init__(self, cloud_name: Optional[str] = None):
         """Initialize OpenStack connection."""
         try:
-            self.conn = openstack.connect(cloud=cloud_name) if cloud_name else openstack.connect()
+            self.conn = _os_connection(cloud_name)
             LOG.info("Connected to OpenStack")
+            # One listing up front makes every later flavor lookup local
+            self._flavors = {flavor.name: flavor for flavor in self.conn.compute.flavors()}
+            self._networks: Dict[str, Any] = {}
+            self._keypairs: Dict[str, Any] = {}
+            self._flavor_map: Dict[str, str] = {}
         except Exception as e:
             LOG.error(f"Failed to connect to OpenStack: {e}")
             raise
 
+    def _find_flavor(self, flavor_name: str) -> Optional[Any]:
+        """Find a flavor by name from the preloaded list, falling back to Nova for IDs."""
+        flavor = self._flavors.get(flavor_name)
+        if flavor is None:
+            flavor = self.conn.compute.find_flavor(flavor_name)
+            if flavor:
+                self._flavors[flavor_name] = flavor
+        return flavor
+
+    def _find_network(self, network_name: str) -> Optional[Any]:
+        """Find a network by name or ID, cached for the duration of the run."""
+        if network_name not in self._networks:
+            self._networks[network_name] = self.conn.network.find_network(network_name)
+        return self._networks[network_name]
+
+    def _find_keypair(self, key_name: str) -> Optional[Any]:
+        """Find a keypair by name, cached for the duration of the run."""
+        if key_name not in self._keypairs:
+            self._keypairs[key_name] = self.conn.compute.find_keypair(key_name)
+        return self._keypairs[key_name]
+
     def map_instance_type(self, aws_instance_type: str) -> str:
-        """Map AWS instance type to OpenStack flavor."""
-        # Basic mapping - adjust based on your OpenStack flavors
-        mapping = {
-            "t2.micro": "m1.tiny",
-            "t2.small": "m1.small",
-            "t2.medium": "m1.medium",
-            "t2.large": "m1.large",
-            "t2.xlarge": "m1.xlarge",
-            "t3.micro": "m1.tiny",
-            "t3.small": "m1.small",
-            "t3.medium": "m1.medium",
-            "t3.large": "m1.large",
-            "m5.large": "m1.large",
-            "m5.xlarge": "m1.xlarge",
-            "m5.2xlarge": "m1.2xlarge",
-        }
-        return mapping.get(aws_instance_type, "m1.medium")
+        """
+        Map AWS instance type to the closest OpenStack flavor.
+        Picks the flavor with the smallest relative vCPU/RAM distance among those at
+        least as large as the EC2 type, so instances are not silently undersized.
+        """
+        if aws_instance_type not in self._flavor_map:
+            self._flavor_map[aws_instance_type] = self._closest_flavor(aws_instance_type)
+        return self._flavor_map[aws_instance_type]
+
+    def _closest_flavor(self, aws_instance_type: str) -> str:
+        """Compute the flavor map_instance_type returns for an EC2 instance type."""
+        spec = AWS_INSTANCE_SPECS.get(aws_instance_type)
+        if spec is None or not self._flavors:
+            LOG.warning(f"No flavor match for {aws_instance_type}, defaulting to m1.medium")
+            return "m1.medium"
+        vcpus, ram = spec
+
+        def distance(flavor: Any) -> float:
+            return ((flavor.vcpus - vcpus) / vcpus) ** 2 + ((flavor.ram - ram) / ram) ** 2
+
+        flavors = list(self._flavors.values())
+        candidates = [f for f in flavors if f.vcpus >= vcpus and f.ram >= ram]
+        if not candidates:
+            LOG.warning(f"No flavor is as large as {aws_instance_type}, using the closest smaller one")
+            candidates = flavors
+        return min(candidates, key=distance).name
 
     def import_image_from_s3(
         self,
@@ -259,49 +617,179 @@ class OpenStackMigrator:
     ) -> Optional[str]:
         """
         Import image from S3 into OpenStack Glance.
-        Note: This requires OpenStack to have access to S3 or the image to be downloaded locally first.
+        Uses the Glance v2 web-download import method, so s3_url must be reachable
+        from Glance (e.g. a presigned URL) and web-download must be enabled.
         """
+        image = None
         try:
-            LOG.info(f"Importing image {image_name} from S3...")
-            # OpenStack Glance can import from various sources
-            # This is a simplified version - actual implementation depends on your setup
+            LOG.info(f"Importing image {image_name} from S3 via web-download...")
             image = self.conn.image.create_image(
                 name=image_name,
                 disk_format=disk_format,
                 container_format=container_format,
                 visibility="private",
             )
-            # Note: Actual import from S3 may require additional steps
-            # such as downloading to local machine first, then uploading to Glance
-            LOG.warning(
-                "Direct S3 import may not be supported. "
-                "Consider downloading the image locally first, then uploading to Glance."
-            )
+            self.conn.image.import_image(image, method="web-download", uri=s3_url)
+            LOG.info(f"Image import initiated: {image.id}")
+            self._wait_for_import(image, wait=3600)
+            LOG.info(f"Image {image.id} is now active")
             return image.id
         except Exception as e:
             LOG.error(f"Failed to import image: {e}")
+            self._delete_partial_image(image)
             return None
 
+    def _wait_for_import(self, image: Any, wait: int, interval: int = 10) -> None:
+        """
+        Wait for an image import to finish.
+        A failed import puts the image back in 'queued' and lists the failed stores
+        in os_glance_failed_import, which wait_for_status would not notice.
+        """
+        deadline = time.monotonic() + wait
+        while True:
+            image = self.conn.image.get_image(image)
+            if image.status == "active":
+                return
+            failed_stores = getattr(image, "os_glance_failed_import", None) or (
+                image.properties or {}
+            ).get("os_glance_failed_import")
+            if image.status == "killed" or (image.status == "queued" and failed_stores):
+                raise RuntimeError(
+                    f"Import of image {image.id} failed (status: {image.status}, "
+                    f"failed stores: {failed_stores or 'n/a'})"
+                )
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Image {image.id} still {image.status} after {wait}s")
+            time.sleep(interval)
+
+    def _delete_partial_image(self, image: Any) -> None:
+        """Remove an image left behind by a failed upload or import."""
+        if image is None:
+            return
+        try:
+            self.conn.image.delete_image(image, ignore_missing=True)
+            LOG.info(f"Deleted incomplete image {image.id}")
+        except Exception as e:
+            LOG.warning(f"Failed to delete incomplete image {image.id}: {e}")
+
+    def import_image_via_rgw_relay(
+        self,
+        image_name: str,
+        s3_client: Any,
+        bucket: str,
+        key: str,
+        rgw_endpoint: str,
+        rgw_bucket: str,
+        rgw_profile: Optional[str] = None,
+        disk_format: str = "raw",
+    ) -> Optional[str]:
+        """
+        Import an exported image by relaying it through an S3-compatible object store
+        (Ceph RGW/MinIO) next to OpenStack, then letting Glance web-download it from there.
+        Every byte streams AWS S3 -> this host -> RGW (multipart, no local disk), so this
+        is only a fallback for when Glance cannot reach the presigned S3 URL itself.
+        """
+        try:
+            rgw = _boto_client("s3", profile=rgw_profile, endpoint_url=rgw_endpoint)
+            config = TransferConfig(
+                multipart_chunksize=16 * 1024 * 1024,
+                max_concurrency=16,
+                use_threads=True,
+            )
+
+            LOG.info(f"Copying s3://{bucket}/{key} to {rgw_endpoint}/{rgw_bucket}...")
+            body = s3_client.get_object(Bucket=bucket, Key=key)["Body"]
+            rgw.upload_fileobj(body, rgw_bucket, key, Config=config)
+            LOG.info("Copy to RGW completed")
+
+            url = rgw.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": rgw_bucket, "Key": key},
+                ExpiresIn=21600,
+            )
+            return self.import_image_from_s3(image_name, url, disk_format=disk_format)
+        except Exception as e:
+            LOG.error(f"Failed to import image through RGW: {e}")
+            return None
+
+    @staticmethod
+    def _iter_file_chunks(
+        file_path: str, chunk_size: int, read_ahead: int
+    ) -> Iterator[bytes]:
+        """Yield a file in order, reading up to read_ahead chunks ahead on worker threads."""
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            offsets = iter(range(0, os.fstat(fd).st_size, chunk_size))
+            with ThreadPoolExecutor(max_workers=read_ahead) as executor:
+                pending = deque(
+                    executor.submit(os.pread, fd, chunk_size, offset)
+                    for _, offset in zip(range(read_ahead), offsets)
+                )
+                while pending:
+                    chunk = pending.popleft().result()
+                    offset = next(offsets, None)
+                    if offset is not None:
+                        pending.append(executor.submit(os.pread, fd, chunk_size, offset))
+                    yield chunk
+        finally:
+            os.close(fd)
+
     def upload_image_file(
-        self, image_name: str, file_path: str, disk_format: str = "raw"
+        self,
+        image_name: str,
+        file_path: str,
+        disk_format: str = "raw",
+        chunk_size: int = 16 * 1024 * 1024,
+        concurrency: int = 8,
+    ) -> Optional[str]:
+        """
+        Upload a local image file to OpenStack Glance.
+        The file is streamed in chunk_size pieces with concurrent read-ahead, so disk
+        reads overlap the upload and memory use stays bounded.
+        """
+        LOG.info(f"Uploading image {image_name} from {file_path}...")
+        return self._upload_image_data(
+            image_name,
+            self._iter_file_chunks(file_path, chunk_size, concurrency),
+            disk_format,
+        )
+
+    def upload_image_stream(
+        self,
+        image_name: str,
+        stream: Any,
+        disk_format: str = "raw",
+        chunk_size: int = 16 * 1024 * 1024,
+    ) -> Optional[str]:
+        """Upload an image to OpenStack Glance from a readable stream (e.g. an S3 object body)."""
+        LOG.info(f"Streaming image {image_name} to Glance...")
+        return self._upload_image_data(
+            image_name, iter(lambda: stream.read(chunk_size), b""), disk_format
+        )
+
+    def _upload_image_data(
+        self, image_name: str, data: Iterator[bytes], disk_format: str
     ) -> Optional[str]:
-        """Upload a local image file to OpenStack Glance."""
+        """Create a Glance image from an iterator of chunks and wait for it to be active."""
+        image = None
         try:
-            LOG.info(f"Uploading image {image_name} from {file_path}...")
             image = self.conn.image.create_image(
                 name=image_name,
-                filename=file_path,
+                data=data,
                 disk_format=disk_format,
                 container_format="bare",
                 visibility="private",
             )
             LOG.info(f"Image upload initiated: {image.id}")
             # Wait for image to be active
-            self.conn.image.wait_for_image(image, status="active", wait=3600)
+            self.conn.image.wait_for_status(
+                image, status="active", failures=["killed"], wait=3600
+            )
             LOG.info(f"Image {image.id} is now active")
             return image.id
         except Exception as e:
             LOG.error(f"Failed to upload image: {e}")
+            self._delete_partial_image(image)
             return None
 
     def create_instance(
@@ -320,12 +808,12 @@ class OpenStackMigrator:
             LOG.info(f"Creating OpenStack instance {name}...")
 
             # Find network
-            network = self.conn.network.find_network(network_name)
+            network = self._find_network(network_name)
             if not network:
                 raise ValueError(f"Network {network_name} not found")
 
             # Find flavor
-            flavor = self.conn.compute.find_flavor(flavor_name)
+            flavor = self._find_flavor(flavor_name)
             if not flavor:
                 raise ValueError(f"Flavor {flavor_name} not found")
 
@@ -341,7 +829,7 @@ class OpenStackMigrator:
             }
 
             if key_name:
-                keypair = self.conn.compute.find_keypair(key_name)
+                keypair = self._find_keypair(key_name)
                 if keypair:
                     server_kwargs["key_name"] = key_name
                 else:
@@ -403,6 +891,188 @@ class OpenStackMigrator:
             return None
 
 
+def _build_fast_ssh_client(
+    host: str, user: str, key: str, port: int = 22
+) -> Tuple["paramiko.Transport", "paramiko.SFTPClient"]:
+    """Open a paramiko SFTP session tuned for bulk transfers over high-latency links."""
+    _require_paramiko()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    # Buffers must be sized before connect() so TCP window scaling can use them
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SSH_SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SSH_SOCKET_BUFFER_SIZE)
+    sock.connect((host, port))
+
+    transport = paramiko.Transport(sock, default_window_size=SSH_WINDOW_SIZE)
+    transport.packetizer.REKEY_BYTES = 2**40
+    transport.use_compression(False)
+    transport.connect(username=user, pkey=paramiko.PKey.from_path(key))
+    return transport, paramiko.SFTPClient.from_transport(transport)
+
+
+class SSHBackend(ABC):
+    """Remote file and command operations against a single SSH host."""
+
+    name = "ssh"
+
+    def __init__(self, host: str, user: str, key: str):
+        self.host = host
+        self.user = user
+        self.key = key
+
+    @abstractmethod
+    def upload(self, local_path: str, remote_path: str) -> None:
+        """Copy a local file to the remote host."""
+
+    @abstractmethod
+    def download(self, remote_path: str, local_path: str) -> None:
+        """Copy a remote file to the local host."""
+
+    @abstractmethod
+    def run(self, command: str) -> str:
+        """Run a command on the remote host and return its stdout."""
+
+    def upload_many(self, files: List[Tuple[str, str]]) -> None:
+        """Copy several (local_path, remote_path) pairs to the remote host."""
+        for local_path, remote_path in files:
+            self.upload(local_path, remote_path)
+
+    def download_many(self, files: List[Tuple[str, str]]) -> None:
+        """Copy several (remote_path, local_path) pairs from the remote host."""
+        for remote_path, local_path in files:
+            self.download(remote_path, local_path)
+
+    def close(self) -> None:
+        """Release any open connection."""
+
+
+class ParamikoSSHBackend(SSHBackend):
+    """SSH backend built on a single tuned paramiko connection."""
+
+    name = "paramiko"
+
+    def __init__(self, host: str, user: str, key: str):
+        super().__init__(host, user, key)
+        self._transport = None
+        self._sftp = None
+
+    def _connect(self) -> "paramiko.SFTPClient":
+        if self._sftp is None:
+            self._transport, self._sftp = _build_fast_ssh_client(
+                self.host, self.user, self.key
+            )
+        return self._sftp
+
+    def upload(self, local_path: str, remote_path: str) -> None:
+        sftp = self._connect()
+        buf = bytearray(SFTP_BLOCK_SIZE)
+        view = memoryview(buf)
+        with open(local_path, "rb") as src, sftp.open(
+            remote_path, "wb", bufsize=SFTP_BLOCK_SIZE
+        ) as dst:
+            dst.set_pipelined(True)
+            while True:
+                read = src.readinto(buf)
+                if not read:
+                    break
+                dst.write(view[:read])
+
+    def download(self, remote_path: str, local_path: str) -> None:
+        self._connect().get(remote_path, local_path)
+
+    def run(self, command: str) -> str:
+        self._connect()
+        channel = self._transport.open_session()
+        try:
+            channel.exec_command(command)
+            stdout = channel.makefile("rb").read()
+            stderr = channel.makefile_stderr("rb").read()
+            if channel.recv_exit_status() != 0:
+                raise RuntimeError(stderr.decode("utf-8", "replace"))
+            return stdout.decode("utf-8", "replace")
+        finally:
+            channel.close()
+
+    def close(self) -> None:
+        if self._sftp is not None:
+            self._sftp.close()
+            self._transport.close()
+            self._sftp = None
+            self._transport = None
+
+
+class AsyncSSHBackend(SSHBackend):
+    """SSH backend built on asyncssh, running many SFTP requests concurrently."""
+
+    name = "asyncssh"
+
+    def _connect(self) -> "asyncssh.SSHClientConnection":
+        return asyncssh.connect(
+            self.host, username=self.user, client_keys=[self.key], known_hosts=None
+        )
+
+    async def _upload_many(self, files: List[Tuple[str, str]]) -> None:
+        async with self._connect() as conn, conn.start_sftp_client() as sftp:
+            semaphore = asyncio.Semaphore(ASYNCSSH_MAX_PARALLEL_FILES)
+
+            async def put(local_path: str, remote_path: str) -> None:
+                async with semaphore:
+                    await sftp.put(
+                        local_path,
+                        remote_path,
+                        block_size=ASYNCSSH_BLOCK_SIZE,
+                        max_requests=ASYNCSSH_MAX_REQUESTS,
+                    )
+
+            await asyncio.gather(*(put(local, remote) for local, remote in files))
+
+    async def _download_many(self, files: List[Tuple[str, str]]) -> None:
+        async with self._connect() as conn, conn.start_sftp_client() as sftp:
+            semaphore = asyncio.Semaphore(ASYNCSSH_MAX_PARALLEL_FILES)
+
+            async def get(remote_path: str, local_path: str) -> None:
+                async with semaphore:
+                    await sftp.get(
+                        remote_path,
+                        local_path,
+                        block_size=ASYNCSSH_BLOCK_SIZE,
+                        max_requests=ASYNCSSH_MAX_REQUESTS,
+                    )
+
+            await asyncio.gather(*(get(remote, local) for remote, local in files))
+
+    async def _run(self, command: str) -> str:
+        async with self._connect() as conn:
+            result = await conn.run(command, check=True)
+            return result.stdout
+
+    def upload(self, local_path: str, remote_path: str) -> None:
+        self.upload_many([(local_path, remote_path)])
+
+    def upload_many(self, files: List[Tuple[str, str]]) -> None:
+        asyncio.run(self._upload_many(files))
+
+    def download(self, remote_path: str, local_path: str) -> None:
+        self.download_many([(remote_path, local_path)])
+
+    def download_many(self, files: List[Tuple[str, str]]) -> None:
+        asyncio.run(self._download_many(files))
+
+    def run(self, command: str) -> str:
+        return asyncio.run(self._run(command))
+
+
+def get_ssh_backend(name: Optional[str], host: str, user: str, key: str) -> SSHBackend:
+    """Return the named SSH backend, preferring asyncssh when installed."""
+    if name is None:
+        name = "asyncssh" if _asyncssh_available() else "paramiko"
+    if name == "asyncssh":
+        if not _asyncssh_available():
+            raise RuntimeError("asyncssh is not installed. Install with: pip install asyncssh")
+        return AsyncSSHBackend(host, user, key)
+    return ParamikoSSHBackend(host, user, key)
+
+
 class DataTransfer:
     """Handles data transfer between EC2 and OpenStack instances."""
 
@@ -417,40 +1087,66 @@ class DataTransfer:
         dest_key: str,
         dest_path: str,
         exclude_patterns: Optional[List[str]] = None,
+        bwlimit: Optional[int] = None,
+        log_path: Optional[Path] = None,
     ) -> bool:
-        """Transfer data using rsync over SSH."""
+        """
+        Transfer data using rsync over SSH.
+        When log_path is given, rsync writes its output straight to that file so
+        Python never sits between rsync and its pipe; otherwise output is captured.
+        """
         try:
             exclude_args = []
             if exclude_patterns:
                 for pattern in exclude_patterns:
                     exclude_args.extend(["--exclude", pattern])
 
+            bwlimit_args = [f"--bwlimit={bwlimit}"] if bwlimit else []
+
             # Use rsync with SSH
             cmd = [
                 "rsync",
                 "-avz",
-                "--progress",
+                "--info=progress2",
                 "-e",
-                f'ssh -i {source_key} -o StrictHostKeyChecking=no',
-            ] + exclude_args + [
+                f'ssh -i {source_key} -o StrictHostKeyChecking=no -o IPQoS=throughput',
+            ] + bwlimit_args + exclude_args + [
                 f"{source_user}@{source_host}:{source_path}/",
                 f"{dest_user}@{dest_host}:{dest_path}/",
             ]
 
             LOG.info(f"Starting rsync transfer from {source_host} to {dest_host}...")
             LOG.info(f"Command: {' '.join(cmd)}")
+            LOG.info(
+                "rsync uses a single TCP stream; on high-latency WAN links raise "
+                "net.core.rmem_max/net.core.wmem_max on both hosts so the TCP window "
+                "can cover the bandwidth-delay product, or use --transfer-backend bbcp"
+            )
+
+            if log_path:
+                LOG.info(f"rsync output is written to {log_path}")
+                with open(log_path, "ab") as log_file:
+                    returncode = subprocess.run(
+                        cmd, stdout=log_file, stderr=subprocess.STDOUT
+                    ).returncode
+                if returncode != 0:
+                    LOG.error(f"rsync failed with exit code {returncode}, see {log_path}")
+                    return False
+                LOG.info("rsync transfer completed successfully")
+                return True
 
             process = subprocess.Popen(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
             )
 
-            # Stream output
-            for line in process.stdout:
-                LOG.info(f"rsync: {line.strip()}")
+            # Drain progress output in large chunks and only format it when debugging
+            while chunk := process.stdout.read1(65536):
+                if LOG.isEnabledFor(logging.DEBUG):
+                    LOG.debug("rsync: %s", chunk.decode("utf-8", "replace").rstrip())
 
             process.wait()
             if process.returncode != 0:
-                error = process.stderr.read()
+                error = process.stderr.read().decode("utf-8", "replace")
                 LOG.error(f"rsync failed: {error}")
                 return False
 
@@ -460,6 +1156,248 @@ class DataTransfer:
             LOG.error(f"Failed to transfer data with rsync: {e}")
             return False
 
+    @staticmethod
+    def transfer_with_bbcp(
+        source_host: str,
+        source_user: str,
+        source_key: str,
+        source_path: str,
+        dest_host: str,
+        dest_user: str,
+        dest_key: str,
+        dest_path: str,
+        streams: int = 4,
+        window: str = "8M",
+    ) -> bool:
+        """
+        Transfer data using bbcp with parallel TCP streams.
+        A single stream rarely fills a high-latency WAN link; bbcp splits the
+        transfer across several streams with a larger socket window.
+        """
+        try:
+            # bbcp starts itself on each end over ssh; give each host its own key
+            ssh_template = "ssh -x -a -o StrictHostKeyChecking=no -i {key} -l %U %H bbcp"
+            cmd = [
+                "bbcp",
+                "-r",
+                "-P",
+                "2",
+                "-s",
+                str(streams),
+                "-w",
+                window,
+                "-S",
+                ssh_template.format(key=shlex.quote(source_key)),
+                "-T",
+                ssh_template.format(key=shlex.quote(dest_key)),
+                f"{source_user}@{source_host}:{source_path}",
+                f"{dest_user}@{dest_host}:{dest_path}",
+            ]
+
+            LOG.info(
+                f"Starting bbcp transfer from {source_host} to {dest_host} "
+                f"({streams} streams, {window} window)..."
+            )
+            LOG.info(f"Command: {' '.join(cmd)}")
+            result = subprocess.run(cmd, capture_output=True, text=True)
+
+            if result.returncode != 0:
+                LOG.error(f"bbcp failed: {result.stderr}")
+                return False
+
+            LOG.info("bbcp transfer completed successfully")
+            return True
+        except Exception as e:
+            LOG.error(f"Failed to transfer data with bbcp: {e}")
+            return False
+
+    @staticmethod
+    def transfer_with_rclone(
+        source_host: str,
+        source_user: str,
+        source_key: str,
+        source_path: str,
+        dest_host: str,
+        dest_user: str,
+        dest_key: str,
+        dest_path: str,
+        exclude_patterns: Optional[List[str]] = None,
+        streams: int = 4,
+        bwlimit: Optional[int] = None,
+    ) -> bool:
+        """Transfer data using rclone between two on-the-fly SFTP remotes."""
+        try:
+            exclude_args = []
+            if exclude_patterns:
+                for pattern in exclude_patterns:
+                    exclude_args.extend(["--exclude", pattern])
+
+            bwlimit_args = ["--bwlimit", str(bwlimit)] if bwlimit else []
+
+            cmd = [
+                "rclone",
+                "copy",
+                "--transfers",
+                str(streams),
+            ] + bwlimit_args + exclude_args + [
+                f":sftp,host={source_host},user={source_user},key_file={source_key}:{source_path}",
+                f":sftp,host={dest_host},user={dest_user},key_file={dest_key}:{dest_path}",
+            ]
+
+            LOG.info(f"Starting rclone transfer from {source_host} to {dest_host}...")
+            LOG.info(f"Command: {' '.join(cmd)}")
+            result = subprocess.run(cmd, capture_output=True, text=True)
+
+            if result.returncode != 0:
+                LOG.error(f"rclone failed: {result.stderr}")
+                return False
+
+            LOG.info("rclone transfer completed successfully")
+            return True
+        except Exception as e:
+            LOG.error(f"Failed to transfer data with rclone: {e}")
+            return False
+
+    @staticmethod
+    def transfer_with_tar_pipe(
+        source_host: str,
+        source_user: str,
+        source_key: str,
+        source_path: str,
+        dest_host: str,
+        dest_user: str,
+        dest_key: str,
+        dest_path: str,
+        exclude_patterns: Optional[List[str]] = None,
+        compress: bool = False,
+    ) -> bool:
+        """
+        Transfer data by streaming a tar archive from source to destination over SSH.
+        All files travel in a single stream, which avoids per-file round-trips
+        when the source path holds many small files. Compression is disabled by
+        default; enable it only for slow WAN links.
+        """
+        try:
+            exclude_args = []
+            if exclude_patterns:
+                for pattern in exclude_patterns:
+                    exclude_args.extend(["--exclude", pattern])
+
+            create_cmd = ["tar", "czf" if compress else "cf", "-", "-C", source_path]
+            create_cmd += exclude_args + ["."]
+            extract_cmd = ["tar", "xzpf" if compress else "xpf", "-", "-C", dest_path]
+
+            source_cmd = [
+                "ssh",
+                "-i",
+                source_key,
+                "-o",
+                "StrictHostKeyChecking=no",
+                f"{source_user}@{source_host}",
+                shlex.join(create_cmd),
+            ]
+            dest_cmd = [
+                "ssh",
+                "-i",
+                dest_key,
+                "-o",
+                "StrictHostKeyChecking=no",
+                f"{dest_user}@{dest_host}",
+                shlex.join(extract_cmd),
+            ]
+
+            LOG.info(f"Starting tar-pipe transfer from {source_host} to {dest_host}...")
+            LOG.info(f"Command: {shlex.join(source_cmd)} | {shlex.join(dest_cmd)}")
+
+            with tempfile.TemporaryFile() as source_stderr:
+                source = subprocess.Popen(
+                    source_cmd, stdout=subprocess.PIPE, stderr=source_stderr
+                )
+                dest = subprocess.Popen(
+                    dest_cmd,
+                    stdin=source.stdout,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+                # Let the source receive SIGPIPE if the destination exits early
+                source.stdout.close()
+                _, dest_error = dest.communicate()
+                source.wait()
+
+                if source.returncode != 0:
+                    source_stderr.seek(0)
+                    error = source_stderr.read().decode("utf-8", "replace")
+                    LOG.error(f"tar-pipe failed on source: {error}")
+                    return False
+
+            if dest.returncode != 0:
+                error = dest_error.decode("utf-8", "replace")
+                LOG.error(f"tar-pipe failed on destination: {error}")
+                return False
+
+            LOG.info("tar-pipe transfer completed successfully")
+            return True
+        except Exception as e:
+            LOG.error(f"Failed to transfer data with tar-pipe: {e}")
+            return False
+
+    @staticmethod
+    def transfer_with_sftp(
+        source_host: str,
+        source_user: str,
+        source_key: str,
+        source_path: str,
+        dest_host: str,
+        dest_user: str,
+        dest_key: str,
+        dest_path: str,
+        ssh_backend: Optional[str] = None,
+        batch_size: int = 256,
+    ) -> bool:
+        """
+        Relay regular files from source to destination over SFTP through this host.
+        Files are staged locally batch_size at a time, using the tuned paramiko or
+        asyncssh backend on each side. Permissions and empty directories are not kept.
+        """
+        source = get_ssh_backend(ssh_backend, source_host, source_user, source_key)
+        dest = get_ssh_backend(ssh_backend, dest_host, dest_user, dest_key)
+        try:
+            LOG.info(
+                f"Starting SFTP relay from {source_host} to {dest_host} via {source.name}..."
+            )
+            listing = source.run(f"cd {shlex.quote(source_path)} && find . -type f -print0")
+            files = [path[2:] for path in listing.split("\0") if path]
+
+            dest_dirs = sorted(
+                {posixpath.join(dest_path, posixpath.dirname(path)) for path in files}
+                | {dest_path}
+            )
+            for start in range(0, len(dest_dirs), 200):
+                dest.run(f"mkdir -p {shlex.join(dest_dirs[start:start + 200])}")
+
+            with tempfile.TemporaryDirectory() as staging:
+                for start in range(0, len(files), batch_size):
+                    batch = files[start:start + batch_size]
+                    local_paths = [os.path.join(staging, str(i)) for i in range(len(batch))]
+                    source.download_many(
+                        [(posixpath.join(source_path, path), local) for path, local in zip(batch, local_paths)]
+                    )
+                    dest.upload_many(
+                        [(local, posixpath.join(dest_path, path)) for path, local in zip(batch, local_paths)]
+                    )
+                    for local in local_paths:
+                        os.unlink(local)
+                    LOG.debug(f"Relayed {start + len(batch)}/{len(files)} files")
+
+            LOG.info(f"SFTP relay of {len(files)} file(s) completed successfully")
+            return True
+        except Exception as e:
+            LOG.error(f"Failed to transfer data with SFTP: {e}")
+            return False
+        finally:
+            source.close()
+            dest.close()
+
     @staticmethod
     def transfer_with_scp(
         source_host: str,
@@ -509,7 +1447,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--aws-instance-id",
         required=True,
-        help="EC2 instance ID to migrate",
+        action="append",
+        help="EC2 instance ID to migrate (can be specified multiple times)",
     )
     parser.add_argument(
         "--aws-region",
@@ -540,10 +1479,52 @@ def parse_args() -> argparse.Namespace:
         "--s3-bucket",
         help="S3 bucket for AMI export",
     )
+    parser.add_argument(
+        "--export-poll-delay",
+        type=int,
+        default=30,
+        help="Seconds between AMI export status checks (default: 30)",
+    )
+    parser.add_argument(
+        "--export-timeout",
+        type=int,
+        default=43200,
+        help="Seconds to wait for an AMI export before giving up (default: 43200)",
+    )
+    parser.add_argument(
+        "--max-concurrent-migrations",
+        type=int,
+        default=4,
+        help="Maximum number of AMIs created/exported at the same time (default: 4)",
+    )
     parser.add_argument(
         "--import-image-file",
         help="Local image file to import into OpenStack (instead of creating from EC2)",
     )
+    parser.add_argument(
+        "--rgw-endpoint",
+        help="S3-compatible endpoint (Ceph RGW/MinIO) next to OpenStack used to stage exported images (optional)",
+    )
+    parser.add_argument(
+        "--rgw-bucket",
+        help="Bucket on the RGW endpoint for staged images",
+    )
+    parser.add_argument(
+        "--rgw-profile",
+        help="AWS profile holding the RGW credentials (optional)",
+    )
+    parser.add_argument(
+        "--image-chunk-size",
+        type=int,
+        default=16,
+        help="Chunk size in MiB used when uploading image files to Glance (default: 16)",
+    )
+    parser.add_argument(
+        "--image-upload-concurrency",
+        type=int,
+        default=8,
+        help="Number of image chunks read ahead while uploading to Glance (default: 8)",
+    )
 
     # OpenStack configuration
     parser.add_argument(
@@ -606,11 +1587,48 @@ def parse_args() -> argparse.Namespace:
         default="ubuntu",
         help="SSH user for OpenStack instance (default: ubuntu)",
     )
+    parser.add_argument(
+        "--ssh-backend",
+        choices=["paramiko", "asyncssh"],
+        help="Python SSH library for the sftp transfer backend (default: asyncssh if installed, else paramiko)",
+    )
     parser.add_argument(
         "--exclude",
         action="append",
         help="Patterns to exclude from transfer (can be specified multiple times)",
     )
+    parser.add_argument(
+        "--transfer-backend",
+        choices=["rsync", "bbcp", "tar", "rclone", "sftp"],
+        default="rsync",
+        help="Tool used for data transfer (default: rsync)",
+    )
+    parser.add_argument(
+        "--bulk-transfer",
+        action="store_true",
+        help="Shortcut for --transfer-backend tar",
+    )
+    parser.add_argument(
+        "--bbcp-streams",
+        type=int,
+        default=4,
+        help="Parallel TCP streams for bbcp; concurrent file transfers (--transfers) for rclone (default: 4)",
+    )
+    parser.add_argument(
+        "--bbcp-window",
+        default="8M",
+        help="TCP window size for bbcp (default: 8M)",
+    )
+    parser.add_argument(
+        "--bwlimit",
+        type=int,
+        help="Bandwidth limit in KiB/s for rsync/rclone transfers (optional)",
+    )
+    parser.add_argument(
+        "--compress-transfer",
+        action="store_true",
+        help="Compress the tar stream (only worthwhile on slow WAN links)",
+    )
 
     # General options
     parser.add_argument(
@@ -618,6 +1636,11 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Directory to save migration metadata (default: ./migration-<timestamp>)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query AWS instead of reusing instance details cached in the output directory",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -629,26 +1652,236 @@ def parse_args() -> argparse.Namespace:
         help="Perform a dry run without making changes",
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    # A repeated ID would otherwise be exported and recreated twice
+    args.aws_instance_id = list(dict.fromkeys(args.aws_instance_id))
+    if args.max_concurrent_migrations < 1:
+        parser.error("--max-concurrent-migrations must be at least 1")
+    if len(args.aws_instance_id) > 1:
+        single_instance_options = {
+            "--ami-name": args.ami_name,
+            "--import-image-file": args.import_image_file,
+            "--openstack-image-name": args.openstack_image_name,
+            "--openstack-instance-name": args.openstack_instance_name,
+        }
+        for option, value in single_instance_options.items():
+            if value:
+                parser.error(f"{option} can only be used when migrating a single instance")
+    return args
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize obj as indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(
+        obj, indent=2, ensure_ascii=False, default=lambda o: o.isoformat()
+    ).encode("utf-8")
 
 
 def save_migration_metadata(
-    output_dir: Path, ec2_info: EC2InstanceInfo, openstack_info: Optional[Dict[str, Any]]
+    output_dir: Path,
+    ec2_info: EC2InstanceInfo,
+    openstack_info: Optional[Dict[str, Any]],
+    file_name: str = "migration_metadata.json",
 ) -> None:
     """Save migration metadata to JSON file."""
     metadata = {
-        "migration_timestamp": datetime.now().isoformat(),
+        "migration_timestamp": datetime.now(),
         "ec2_instance": ec2_info.to_dict(),
         "openstack_instance": openstack_info,
     }
 
-    metadata_file = output_dir / "migration_metadata.json"
-    with open(metadata_file, "w") as f:
-        json.dump(metadata, f, indent=2)
+    metadata_file = output_dir / file_name
+    with open(metadata_file, "wb") as f:
+        f.write(_dump_json(metadata))
 
     LOG.info(f"Migration metadata saved to {metadata_file}")
 
 
+async def prepare_images(
+    aws_migrator: EC2Migrator,
+    ec2_infos: List[EC2InstanceInfo],
+    args: argparse.Namespace,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Create (and optionally export) AMIs for all instances concurrently.
+    AMI creation and export run server-side, so N instances take roughly as long
+    as one; the semaphore keeps the number of in-flight jobs below API limits.
+    Returns the export info (or None) keyed by instance ID. Instances whose AMI
+    creation or export failed are logged and left out, so the rest still migrate.
+    """
+    semaphore = asyncio.Semaphore(args.max_concurrent_migrations)
+
+    async def prepare(ec2_info: EC2InstanceInfo) -> Tuple[str, Optional[Dict[str, Any]]]:
+        async with semaphore:
+            date = datetime.now().strftime("%Y%m%d")
+            ami_name = args.ami_name or f"{ec2_info.name}-{ec2_info.instance_id}-migration-{date}"
+            ami_id = await aws_migrator.async_create_ami(
+                ec2_info.instance_id, ami_name, f"Migration AMI for {ec2_info.instance_id}"
+            )
+            LOG.info(f"Created AMI: {ami_id}")
+
+            # Export to S3 if requested
+            export_info = None
+            if args.export_to_s3 and args.s3_bucket:
+                export_info = await aws_migrator.async_export_ami_to_s3(
+                    ami_id,
+                    args.s3_bucket,
+                    "ami-exports/",
+                    poll_delay=args.export_poll_delay,
+                    timeout=args.export_timeout,
+                )
+                if export_info:
+                    LOG.info(f"Exported AMI to S3: {export_info['s3_location']}")
+            return ec2_info.instance_id, export_info
+
+    results = await asyncio.gather(
+        *(prepare(ec2_info) for ec2_info in ec2_infos), return_exceptions=True
+    )
+    export_infos = {}
+    for ec2_info, result in zip(ec2_infos, results):
+        if isinstance(result, BaseException):
+            LOG.error(f"Image preparation failed for {ec2_info.instance_id}: {result}")
+            continue
+        instance_id, export_info = result
+        export_infos[instance_id] = export_info
+    return export_infos
+
+
+def migrate_instance(
+    args: argparse.Namespace,
+    aws_migrator: EC2Migrator,
+    openstack_migrator: OpenStackMigrator,
+    ec2_info: EC2InstanceInfo,
+    export_info: Optional[Dict[str, Any]],
+    output_dir: Path,
+    metadata_file_name: str,
+) -> Optional[Dict[str, Any]]:
+    """Import the image, create the OpenStack instance and transfer data for one EC2 instance."""
+    # Import image if provided
+    openstack_image_id = None
+    if args.import_image_file and not args.dry_run:
+        image_name = args.openstack_image_name or f"{ec2_info.name}-{ec2_info.instance_id}-imported"
+        openstack_image_id = openstack_migrator.upload_image_file(
+            image_name,
+            args.import_image_file,
+            chunk_size=args.image_chunk_size * 1024 * 1024,
+            concurrency=args.image_upload_concurrency,
+        )
+        if openstack_image_id:
+            LOG.info(f"Imported image to OpenStack: {openstack_image_id}")
+    elif export_info and not args.dry_run:
+        image_name = args.openstack_image_name or f"{ec2_info.name}-{ec2_info.instance_id}-imported"
+        bucket, key = aws_migrator.get_export_location(export_info)
+        openstack_image_id = openstack_migrator.import_image_from_s3(
+            image_name, aws_migrator.get_export_url(export_info)
+        )
+        if not openstack_image_id and args.rgw_endpoint and args.rgw_bucket:
+            LOG.info("Glance could not import from S3, relaying the image through RGW")
+            openstack_image_id = openstack_migrator.import_image_via_rgw_relay(
+                image_name,
+                aws_migrator.s3,
+                bucket,
+                key,
+                rgw_endpoint=args.rgw_endpoint,
+                rgw_bucket=args.rgw_bucket,
+                rgw_profile=args.rgw_profile,
+            )
+        if not openstack_image_id:
+            LOG.info("Falling back to streaming the exported image through this host")
+            body = aws_migrator.s3.get_object(Bucket=bucket, Key=key)["Body"]
+            openstack_image_id = openstack_migrator.upload_image_stream(
+                image_name, body, chunk_size=args.image_chunk_size * 1024 * 1024
+            )
+        if openstack_image_id:
+            LOG.info(f"Imported image to OpenStack: {openstack_image_id}")
+
+    # Create OpenStack instance
+    openstack_info = None
+    if openstack_image_id and not args.dry_run:
+        instance_name = args.openstack_instance_name or ec2_info.name
+        flavor_name = args.openstack_flavor or openstack_migrator.map_instance_type(
+            ec2_info.instance_type
+        )
+        keypair_name = args.openstack_keypair or ec2_info.key_name
+
+        openstack_info = openstack_migrator.create_instance(
+            name=instance_name,
+            image_id=openstack_image_id,
+            flavor_name=flavor_name,
+            key_name=keypair_name,
+            network_name=args.openstack_network,
+            volume_size=sum(vol["size"] for vol in ec2_info.volumes) if ec2_info.volumes else None,
+        )
+        LOG.info(f"Created OpenStack instance: {openstack_info['server_id']}")
+
+    # Transfer data if requested
+    if args.transfer_data and ec2_info.public_ip and openstack_info and not args.dry_run:
+        dest_ip = openstack_info.get("floating_ip") or openstack_info.get("private_ip")
+        if not dest_ip:
+            LOG.warning("Could not determine OpenStack instance IP, skipping data transfer")
+        elif not args.source_key or not args.dest_key:
+            LOG.warning("SSH keys not provided, skipping data transfer")
+        else:
+            LOG.info("Starting data transfer...")
+            transfer_kwargs = {
+                "source_host": ec2_info.public_ip,
+                "source_user": args.source_user,
+                "source_key": args.source_key,
+                "source_path": args.source_path,
+                "dest_host": dest_ip,
+                "dest_user": args.dest_user,
+                "dest_key": args.dest_key,
+                "dest_path": args.dest_path,
+            }
+            backend = "tar" if args.bulk_transfer else args.transfer_backend
+            if backend == "tar":
+                success = DataTransfer.transfer_with_tar_pipe(
+                    exclude_patterns=args.exclude,
+                    compress=args.compress_transfer,
+                    **transfer_kwargs,
+                )
+            elif backend == "bbcp":
+                if args.exclude:
+                    LOG.warning("bbcp does not support exclude patterns, ignoring --exclude")
+                success = DataTransfer.transfer_with_bbcp(
+                    streams=args.bbcp_streams,
+                    window=args.bbcp_window,
+                    **transfer_kwargs,
+                )
+            elif backend == "sftp":
+                if args.exclude:
+                    LOG.warning("The sftp backend does not support exclude patterns, ignoring --exclude")
+                success = DataTransfer.transfer_with_sftp(
+                    ssh_backend=args.ssh_backend,
+                    **transfer_kwargs,
+                )
+            elif backend == "rclone":
+                success = DataTransfer.transfer_with_rclone(
+                    exclude_patterns=args.exclude,
+                    streams=args.bbcp_streams,
+                    bwlimit=args.bwlimit,
+                    **transfer_kwargs,
+                )
+            else:
+                success = DataTransfer.transfer_with_rsync(
+                    exclude_patterns=args.exclude,
+                    bwlimit=args.bwlimit,
+                    log_path=None if args.verbose else output_dir / "rsync.log",
+                    **transfer_kwargs,
+                )
+            if success:
+                LOG.info("Data transfer completed successfully")
+            else:
+                LOG.error("Data transfer failed")
+
+    # Save migration metadata
+    save_migration_metadata(output_dir, ec2_info, openstack_info, metadata_file_name)
+
+    return openstack_info
+
+
 def main() -> None:
     """Main migration function."""
     args = parse_args()
@@ -668,7 +1901,7 @@ def main() -> None:
         output_dir = Path(f"./migration-{timestamp}")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    LOG.info(f"Starting migration of EC2 instance {args.aws_instance_id}")
+    LOG.info(f"Starting migration of EC2 instance(s) {', '.join(args.aws_instance_id)}")
     LOG.info(f"Output directory: {output_dir}")
 
     if args.dry_run:
@@ -676,94 +1909,52 @@ def main() -> None:
 
     try:
         # Initialize AWS client
-        aws_migrator = EC2Migrator(region=args.aws_region, profile=args.aws_profile)
+        aws_migrator = EC2Migrator(
+            region=args.aws_region,
+            profile=args.aws_profile,
+            cache_dir=None if args.no_cache else output_dir / ".cache",
+        )
 
         # Get EC2 instance information
-        LOG.info(f"Fetching EC2 instance details for {args.aws_instance_id}...")
-        ec2_info = aws_migrator.get_instance(args.aws_instance_id)
-        LOG.info(f"Found instance: {ec2_info.name} ({ec2_info.instance_type})")
-
-        # Create AMI if requested
-        ami_id = None
+        LOG.info(f"Fetching EC2 instance details for {', '.join(args.aws_instance_id)}...")
+        ec2_infos = aws_migrator.get_instances(args.aws_instance_id)
+        for ec2_info in ec2_infos:
+            LOG.info(f"Found instance: {ec2_info.name} ({ec2_info.instance_type})")
+
+        # Create (and export) AMIs if requested
+        export_infos = {}
+        failed_ids = []
         if args.create_ami and not args.dry_run:
-            ami_name = args.ami_name or f"{ec2_info.name}-migration-{datetime.now().strftime('%Y%m%d')}"
-            ami_id = aws_migrator.create_ami(
-                args.aws_instance_id, ami_name, f"Migration AMI for {ec2_info.instance_id}"
-            )
-            LOG.info(f"Created AMI: {ami_id}")
-
-        # Export to S3 if requested
-        export_info = None
-        if args.export_to_s3 and ami_id and args.s3_bucket and not args.dry_run:
-            export_info = aws_migrator.export_ami_to_s3(
-                ami_id, args.s3_bucket, "ami-exports"
-            )
-            if export_info:
-                LOG.info(f"Exported AMI to S3: {export_info['s3_location']}")
+            export_infos = asyncio.run(prepare_images(aws_migrator, ec2_infos, args))
+            failed_ids = [i.instance_id for i in ec2_infos if i.instance_id not in export_infos]
+            ec2_infos = [i for i in ec2_infos if i.instance_id in export_infos]
 
         # Initialize OpenStack client
         openstack_migrator = OpenStackMigrator(cloud_name=args.openstack_cloud)
 
-        # Import image if provided
-        openstack_image_id = None
-        if args.import_image_file and not args.dry_run:
-            image_name = args.openstack_image_name or f"{ec2_info.name}-imported"
-            openstack_image_id = openstack_migrator.upload_image_file(
-                image_name, args.import_image_file
+        for ec2_info in ec2_infos:
+            metadata_file_name = (
+                f"migration_metadata-{ec2_info.instance_id}.json"
+                if len(args.aws_instance_id) > 1
+                else "migration_metadata.json"
             )
-            if openstack_image_id:
-                LOG.info(f"Imported image to OpenStack: {openstack_image_id}")
-
-        # Create OpenStack instance
-        openstack_info = None
-        if openstack_image_id and not args.dry_run:
-            instance_name = args.openstack_instance_name or ec2_info.name
-            flavor_name = args.openstack_flavor or openstack_migrator.map_instance_type(
-                ec2_info.instance_type
+            openstack_info = migrate_instance(
+                args,
+                aws_migrator,
+                openstack_migrator,
+                ec2_info,
+                export_infos.get(ec2_info.instance_id),
+                output_dir,
+                metadata_file_name,
             )
-            keypair_name = args.openstack_keypair or ec2_info.key_name
-
-            openstack_info = openstack_migrator.create_instance(
-                name=instance_name,
-                image_id=openstack_image_id,
-                flavor_name=flavor_name,
-                key_name=keypair_name,
-                network_name=args.openstack_network,
-                volume_size=sum(vol["size"] for vol in ec2_info.volumes) if ec2_info.volumes else None,
-            )
-            LOG.info(f"Created OpenStack instance: {openstack_info['server_id']}")
-
-        # Transfer data if requested
-        if args.transfer_data and ec2_info.public_ip and openstack_info and not args.dry_run:
-            dest_ip = openstack_info.get("floating_ip") or openstack_info.get("private_ip")
-            if not dest_ip:
-                LOG.warning("Could not determine OpenStack instance IP, skipping data transfer")
-            elif not args.source_key or not args.dest_key:
-                LOG.warning("SSH keys not provided, skipping data transfer")
-            else:
-                LOG.info("Starting data transfer...")
-                success = DataTransfer.transfer_with_rsync(
-                    source_host=ec2_info.public_ip,
-                    source_user=args.source_user,
-                    source_key=args.source_key,
-                    source_path=args.source_path,
-                    dest_host=dest_ip,
-                    dest_user=args.dest_user,
-                    dest_key=args.dest_key,
-                    dest_path=args.dest_path,
-                    exclude_patterns=args.exclude,
-                )
-                if success:
-                    LOG.info("Data transfer completed successfully")
-                else:
-                    LOG.error("Data transfer failed")
 
-        # Save migration metadata
-        save_migration_metadata(output_dir, ec2_info, openstack_info)
+            if openstack_info:
+                LOG.info(f"OpenStack instance accessible at: {openstack_info.get('floating_ip') or openstack_info.get('private_ip')}")
 
+        if failed_ids:
+            LOG.error(f"Migration incomplete, image preparation failed for: {', '.join(failed_ids)}")
+            sys.exit(1)
         LOG.info("Migration process completed")
-        if openstack_info:
-            LOG.info(f"OpenStack instance accessible at: {openstack_info.get('floating_ip') or openstack_info.get('private_ip')}")
 
     except Exception as e:
         LOG.error(f"Migration failed: {e}", exc_info=args.verbose)
@@ -10,17 +10,36 @@ team.
 """
 
 import argparse
+import bisect
+import codecs
 import json
 import logging
+import os
+import posixpath
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
 import zipfile
-from datetime import datetime
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from textwrap import dedent
+from typing import Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
 
 LOG = logging.getLogger("azure_to_openfaas")
 
@@ -43,6 +62,38 @@ LANGUAGE_TEMPLATE_MAP = {
     "bash": "bash",
     "java": "java8",
 }
+# Directory scans try extensions in this order; the first one present wins
+_EXT_ORDER = tuple(EXTENSION_LANGUAGE_MAP.items())
+# Bundles are short-lived hand-offs, so favour deflate speed over archive size
+ZIP_COMPRESSLEVEL = 1
+# Directory names never extracted from --zip-path sources
+_ZIP_SKIP_DIRS = frozenset({"node_modules", ".git", "__pycache__"})
+_SLUG_BAD = re.compile(r"[^a-z0-9-]+")
+_SLUG_DUPDASH = re.compile(r"-{2,}")
+
+
+def _json_bytes(obj, indent: bool = True) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _load_json_file(path: str):
+    """Parse a small JSON file from raw bytes, skipping text decoding."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    # Editors on Windows often save host.json/function.json with a UTF-8 BOM
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8) :]
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def parse_args() -> argparse.Namespace:
@@ -116,20 +167,55 @@ def parse_args() -> argparse.Namespace:
 def slugify(value: str) -> str:
     if not value:
         return "function"
-    token = re.sub(r"[^a-z0-9-]+", "-", value.lower())
-    token = re.sub(r"-{2,}", "-", token).strip("-")
+    token = _SLUG_BAD.sub("-", value.lower())
+    token = _SLUG_DUPDASH.sub("-", token).strip("-")
     return token or "function"
 
 
 def normalize_repo_root(candidate: Path) -> Path:
-    entries = [p for p in candidate.iterdir() if not p.name.startswith(".")]
-    if len(entries) == 1 and entries[0].is_dir():
-        return normalize_repo_root(entries[0])
-    return candidate
-
-
-def run_git_clone(repo_url: str, target: Path, verbose: bool) -> None:
-    cmd = ["git", "clone", "--depth", "1", repo_url, str(target)]
+    # Descend while the only visible entry is a directory (e.g. GitHub's <repo>-<sha>/ wrapper)
+    path = str(candidate)
+    while True:
+        with os.scandir(path) as it:
+            entries = [entry for entry in it if not entry.name.startswith(".")]
+        if len(entries) != 1 or not entries[0].is_dir(follow_symlinks=False):
+            return Path(path)
+        path = entries[0].path
+
+
+def _listing_root(paths: list[str]) -> str:
+    """Apply normalize_repo_root to a git path listing, returning the chosen prefix."""
+    prefix = ""
+    while True:
+        children: dict[str, bool] = {}
+        for path in paths:
+            if not path.startswith(prefix):
+                continue
+            head, sep, _ = path[len(prefix) :].partition("/")
+            if not head.startswith("."):
+                children[head] = children.get(head, False) or bool(sep)
+        if len(children) != 1:
+            return prefix
+        ((name, is_dir),) = children.items()
+        if not is_dir:
+            return prefix
+        prefix += name + "/"
+
+
+def run_git_clone(repo_url: str, target: Path, verbose: bool) -> Path:
+    # Partial clone: only trees come down up front, blobs are fetched on checkout
+    cmd = [
+        "git",
+        "clone",
+        "--depth",
+        "1",
+        "--filter=blob:none",
+        "--no-tags",
+        "--single-branch",
+        "--no-checkout",
+        repo_url,
+        str(target),
+    ]
     LOG.info("Cloning %s into %s", repo_url, target)
     kwargs = {"check": True}
     if not verbose:
@@ -137,6 +223,77 @@ def run_git_clone(repo_url: str, target: Path, verbose: bool) -> None:
         kwargs["stderr"] = subprocess.PIPE
     subprocess.run(cmd, **kwargs)
 
+    # Only function directories are copied into the bundle, so skip the rest of the tree
+    scan_root = None
+    try:
+        listing = subprocess.run(
+            ["git", "-C", str(target), "ls-tree", "-r", "-z", "--name-only", "HEAD"],
+            check=True,
+            capture_output=True,
+        ).stdout.decode("utf-8", "surrogateescape")
+        paths = [path for path in listing.split("\0") if path]
+        function_dirs = sorted(
+            {os.path.dirname(path) for path in paths if os.path.basename(path) == "function.json"}
+        )
+        if function_dirs and "" not in function_dirs:
+            subprocess.run(["git", "-C", str(target), "sparse-checkout", "init", "--cone"], **kwargs)
+            subprocess.run(["git", "-C", str(target), "sparse-checkout", "set", *function_dirs], **kwargs)
+            # A sparse tree hides sibling directories, so resolve the root from the full listing
+            scan_root = _listing_root(paths)
+            LOG.debug("Sparse checkout of %d function directories", len(function_dirs))
+    except subprocess.CalledProcessError as exc:
+        LOG.warning("Sparse checkout unavailable (%s); checking out the full tree", exc)
+        subprocess.run(["git", "-C", str(target), "sparse-checkout", "disable"], check=False, capture_output=True)
+        scan_root = None
+
+    subprocess.run(["git", "-C", str(target), "checkout"], **kwargs)
+    if scan_root is None:
+        return normalize_repo_root(target)
+    return target / scan_root
+
+
+def _plain_zip_name(name: str) -> bool:
+    """True when the entry extracts to the path its name spells (ZipFile.extract sanitises the rest)."""
+    parts = name.split("/")
+    return not (
+        "\\" in name
+        or name.startswith("/")
+        or ":" in parts[0]
+        or ".." in parts
+        or "." in parts
+        or "" in parts[:-1]
+    )
+
+
+def _skip_zip_member(name: str) -> bool:
+    """True for vendored, VCS and bytecode entries the converter never needs."""
+    return name.endswith(".pyc") or not _ZIP_SKIP_DIRS.isdisjoint(name.split("/")[:-1])
+
+
+def extract_zip_source(zip_path: Path, work_dir: Path) -> None:
+    """Extract zip_path into work_dir, leaving out the entries _skip_zip_member rejects."""
+    root = str(work_dir)
+    skipped = 0
+    with zipfile.ZipFile(zip_path, "r") as archive:
+        for info in archive.infolist():
+            name = info.filename
+            if _skip_zip_member(name):
+                skipped += 1
+                continue
+            if not _plain_zip_name(name):
+                archive.extract(info, root)
+                continue
+
+            target = os.path.join(root, *name.split("/"))
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with archive.open(info) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+    if skipped:
+        LOG.debug("Skipped %d vendored or cached zip entries", skipped)
+
 
 def prepare_source_dir(args: argparse.Namespace, work_dir: Path) -> Path:
     if args.function_file:
@@ -161,16 +318,13 @@ def prepare_source_dir(args: argparse.Namespace, work_dir: Path) -> Path:
             "bindings": bindings,
         }
 
-        (function_root / "function.json").write_text(
-            json.dumps(function_json, indent=2), encoding="utf-8"
-        )
+        _write_bytes(function_root / "function.json", _json_bytes(function_json))
         LOG.info("Staged single function %s from %s", function_name, function_file)
         return bundle_root
 
     if args.repo_url:
         target = work_dir / "repo"
-        run_git_clone(args.repo_url, target, args.verbose)
-        return normalize_repo_root(target)
+        return run_git_clone(args.repo_url, target, args.verbose)
 
     if args.zip_path:
         zip_path = args.zip_path.expanduser()
@@ -178,8 +332,7 @@ def prepare_source_dir(args: argparse.Namespace, work_dir: Path) -> Path:
         if not zip_path.exists():
             raise FileNotFoundError(f"Zip archive not found: {zip_path}")
         LOG.info("Extracting %s into %s", zip_path, work_dir)
-        with zipfile.ZipFile(args.zip_path, "r") as archive:
-            archive.extractall(work_dir)
+        extract_zip_source(zip_path, work_dir)
         return normalize_repo_root(work_dir)
 
     repo_path = args.repo_path.expanduser().resolve()
@@ -190,46 +343,83 @@ def prepare_source_dir(args: argparse.Namespace, work_dir: Path) -> Path:
 
 
 def determine_language(script_file: str | None, function_dir: Path) -> str:
-    candidate_ext = None
     if script_file:
-        candidate_ext = Path(script_file).suffix.lower()
-    else:
-        for ext in EXTENSION_LANGUAGE_MAP:
-            if any(function_dir.glob(f"*{ext}")):
-                candidate_ext = ext
-                break
-    return EXTENSION_LANGUAGE_MAP.get(candidate_ext, "generic")
+        return EXTENSION_LANGUAGE_MAP.get(os.path.splitext(script_file)[1].lower(), "generic")
+
+    # One directory listing instead of a glob per known extension
+    try:
+        with os.scandir(function_dir) as it:
+            present = {
+                os.path.splitext(entry.name)[1].lower()
+                for entry in it
+                if entry.is_file(follow_symlinks=False)
+            }
+    except OSError:
+        return "generic"
+    for ext, language in _EXT_ORDER:
+        if ext in present:
+            return language
+    return "generic"
 
 
-def unique_name(base: str, seen: dict[str, int]) -> str:
+def unique_name(base: str, seen: Counter[str]) -> str:
     base = slugify(base)
-    count = seen.get(base, 0)
-    seen[base] = count + 1
-    return base if count == 0 else f"{base}-{count + 1}"
+    seen[base] += 1
+    count = seen[base]
+    return base if count == 1 else f"{base}-{count}"
+
+
+def _scandir_recursive(path: str) -> Iterator[os.DirEntry]:
+    """Yield non-directory entries below path, each directory's files before its subdirectories."""
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except PermissionError:
+        LOG.warning("Skipping unreadable directory %s", path)
+        return
+
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        else:
+            yield entry
+    for subdir in subdirs:
+        yield from _scandir_recursive(subdir)
 
 
 def find_azure_functions(root: Path) -> list[dict]:
     functions = []
-    seen_names: dict[str, int] = {}
-    for function_json in root.rglob("function.json"):
+    seen_names: Counter[str] = Counter()
+    root_str = str(root)
+    # Slice relative paths off the scanned entries instead of building Path objects per hit.
+    prefix_len = len(os.path.join(root_str, ""))
+    for entry in _scandir_recursive(root_str):
+        if entry.name != "function.json" or not entry.is_file():
+            continue
+
+        function_json = Path(entry.path)
         try:
-            payload = json.loads(function_json.read_text())
+            payload = _load_json_file(entry.path)
         except json.JSONDecodeError:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             LOG.warning("Skipping invalid JSON at %s", function_json)
             continue
 
         function_dir = function_json.parent
-        relative_path = function_dir.relative_to(root)
+        relative_dir = os.path.dirname(entry.path[prefix_len:]).replace(os.sep, "/")
+        relative_path = relative_dir or "."
+        function_name = os.path.basename(relative_dir)
         script_file = payload.get("scriptFile")
         entry_point = payload.get("entryPoint")
         language = determine_language(script_file, function_dir)
-        faas_name = unique_name(relative_path.name, seen_names)
+        faas_name = unique_name(function_name, seen_names)
 
         functions.append(
             {
-                "name": relative_path.name,
+                "name": function_name,
                 "faas_name": faas_name,
-                "relative_path": str(relative_path),
+                "relative_path": relative_path,
                 "script_file": script_file,
                 "entry_point": entry_point,
                 "language": language,
@@ -241,37 +431,169 @@ def find_azure_functions(root: Path) -> list[dict]:
     return functions
 
 
-def copy_functions(functions: list[dict], repo_root: Path, out_root: Path) -> None:
-    functions_root = out_root / "functions"
-    functions_root.mkdir(parents=True, exist_ok=True)
+def _fast_copytree(src: str, dst: str) -> None:
+    """Copy files from src into dst with their permission bits, skipping timestamps and other metadata."""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _fast_copytree(entry.path, target)
+            else:
+                shutil.copy(entry.path, target)
 
-    for info in functions:
-        source = repo_root / info["relative_path"]
-        destination = functions_root / info["faas_name"]
-        azure_target = destination / "azure"
-
-        LOG.info("Copying Azure function %s -> %s", source, azure_target)
-        shutil.copytree(source, azure_target, dirs_exist_ok=True)
-
-        info["azure_path"] = str(azure_target.relative_to(out_root))
-
-        metadata = {
-            "name": info["name"],
-            "faas_name": info["faas_name"],
-            "relative_path": info["relative_path"],
-            "script_file": info["script_file"],
-            "entry_point": info["entry_point"],
-            "language": info["language"],
-            "faas_template": info["faas_template"],
-            "bindings": info["bindings"],
-            "azure_path": info["azure_path"],
-        }
 
-        with open(destination / "function-metadata.json", "w", encoding="utf-8") as handle:
-            json.dump(metadata, handle, indent=2)
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path with raw os calls, skipping Python's buffered file objects."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _zip_entry(arcname: str) -> zipfile.ZipInfo:
+    """Build a zip entry for a file generated in memory."""
+    entry = zipfile.ZipInfo(arcname, date_time=time.localtime()[:6])
+    entry.compress_type = zipfile.ZIP_DEFLATED
+    _set_compress_level(entry, ZIP_COMPRESSLEVEL)
+    entry.external_attr = 0o644 << 16
+    return entry
+
+
+def _emit(out_root: Path, arcname: str, data: bytes, archive: zipfile.ZipFile | None) -> None:
+    """Write a generated file to the bundle directory and, when given, straight into the zip."""
+    _write_bytes(out_root / arcname, data)
+    if archive is not None:
+        archive.writestr(_zip_entry(arcname), data)
+
 
-        readme_text = _build_function_readme(info)
-        (destination / "README.md").write_text(readme_text, encoding="utf-8")
+def _zip_tree(archive: zipfile.ZipFile, src: str, arcname: str) -> None:
+    """Add src and everything below it to the archive under arcname, following symlinks like _fast_copytree."""
+    archive.write(src, arcname)
+    for dirpath, dirnames, filenames in os.walk(src, followlinks=True):
+        relative = os.path.relpath(dirpath, src)
+        prefix = arcname if relative == "." else f"{arcname}/{relative.replace(os.sep, '/')}"
+        for name in dirnames + filenames:
+            archive.write(os.path.join(dirpath, name), f"{prefix}/{name}")
+
+
+# zipfile internals: _set_compress_level is the only code touching a private zipfile attribute.
+
+
+def _set_compress_level(entry: zipfile.ZipInfo, level: int) -> None:
+    """Set an entry's deflate level; ZipFile.open(..., "w") ignores the archive's level for caller-built entries."""
+    if hasattr(entry, "compress_level"):  # public from Python 3.13
+        entry.compress_level = level
+    else:
+        entry._compresslevel = level
+
+
+def _zip_tree_from_zip(
+    archive: zipfile.ZipFile,
+    source: zipfile.ZipFile,
+    names: list[str],
+    src: str,
+    prefix: str,
+    arcname: str,
+) -> None:
+    """Copy the source zip's entries under prefix into the archive under arcname."""
+    archive.write(src, arcname)
+    start = bisect.bisect_left(names, prefix)
+    for index in range(start, len(names)):
+        name = names[index]
+        if not name.startswith(prefix):
+            break
+        rest = name[len(prefix) :]
+        if not rest:
+            continue
+        info = source.getinfo(name)
+        target = f"{arcname}/{rest}"
+        if info.is_dir():
+            archive.writestr(target, b"")
+        else:
+            archive.writestr(_zip_entry(target), source.read(info))
+
+
+def _process_one(info: dict, repo_root: Path, functions_root: Path, out_root: Path) -> dict[str, bytes]:
+    source = repo_root / info["relative_path"]
+    destination = functions_root / info["faas_name"]
+    azure_target = destination / "azure"
+
+    LOG.info("Copying Azure function %s -> %s", source, azure_target)
+    _fast_copytree(str(source), str(azure_target))
+
+    info["azure_path"] = str(azure_target.relative_to(out_root))
+
+    metadata = {
+        "name": info["name"],
+        "faas_name": info["faas_name"],
+        "relative_path": info["relative_path"],
+        "script_file": info["script_file"],
+        "entry_point": info["entry_point"],
+        "language": info["language"],
+        "faas_template": info["faas_template"],
+        "bindings": info["bindings"],
+        "azure_path": info["azure_path"],
+    }
+
+    # Generated files are handed back so the caller can zip them without reading them again
+    generated = {
+        "function-metadata.json": _json_bytes(metadata),
+        "README.md": _build_function_readme(info).encode(),
+    }
+    for name, data in generated.items():
+        _write_bytes(destination / name, data)
+    return generated
+
+
+def copy_functions(
+    functions: list[dict],
+    repo_root: Path,
+    out_root: Path,
+    archive: zipfile.ZipFile | None = None,
+    source_zip: zipfile.ZipFile | None = None,
+    source_zip_root: str = ".",
+) -> None:
+    functions_root = out_root / "functions"
+    functions_root.mkdir(parents=True, exist_ok=True)
+    if archive is not None:
+        archive.write(functions_root, "functions")
+
+    # With a zip source, the function entries are read straight from it instead of from disk
+    source_names = None
+    if archive is not None and source_zip is not None:
+        names = source_zip.namelist()
+        if all(_plain_zip_name(name) for name in names):
+            source_names = sorted(name for name in names if not _skip_zip_member(name))
+        else:
+            LOG.debug("Source zip has entry names that do not map to disk; zipping from disk")
+
+    # Each function writes to its own destination tree, so they can run side by side
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(_process_one, info, repo_root, functions_root, out_root)
+            for info in functions
+        ]
+        for info, future in zip(functions, futures):
+            generated = future.result()
+            if archive is None:
+                continue
+            # Zip from the main thread so entry order does not depend on scheduling
+            arc_root = f"functions/{info['faas_name']}"
+            archive.write(functions_root / info["faas_name"], arc_root)
+            source = str(repo_root / info["relative_path"])
+            if source_names is None:
+                _zip_tree(archive, source, f"{arc_root}/azure")
+            else:
+                prefix = posixpath.normpath(posixpath.join(source_zip_root, info["relative_path"])) + "/"
+                if prefix == "./":
+                    prefix = ""
+                _zip_tree_from_zip(archive, source_zip, source_names, source, prefix, f"{arc_root}/azure")
+            for name, data in generated.items():
+                archive.writestr(_zip_entry(f"{arc_root}/{name}"), data)
 
 
 def _build_function_readme(info: dict) -> str:
@@ -328,30 +650,48 @@ def write_stack_yaml(
     registry_prefix: str | None,
     gateway: str,
     stack_name: str,
+    archive: zipfile.ZipFile | None = None,
 ) -> None:
     stack_path = out_root / "stack.yml"
     prefix = registry_prefix.rstrip("/") if registry_prefix else ""
-    lines = [
-        f"# Generated stack: {stack_name}",
-        "provider:",
-        "  name: openfaas",
-        f"  gateway: {gateway}",
-        "functions:",
-    ]
-
-    for info in functions:
-        lines.append(f"  {info['faas_name']}:")
-        lines.append(f"    lang: {info['faas_template']}")
-        lines.append(f"    handler: ./functions/{info['faas_name']}")
-        image = f"{prefix}/{info['faas_name']}:latest" if prefix else f"{info['faas_name']}:latest"
-        lines.append(f"    image: {image}")
-        lines.append("    annotations:")
-        lines.append(f"      azure-path: '{info['relative_path']}'")
-        bindings_json = json.dumps(info["bindings"], separators=(",", ":"))
-        lines.append(f"      azure-bindings: '{bindings_json}'")
-        lines.append("")
-
-    stack_path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    with ExitStack() as stack:
+        sinks = [stack.enter_context(open(stack_path, "wb", buffering=1 << 20))]
+        if archive is not None:
+            sinks.append(stack.enter_context(archive.open(_zip_entry("stack.yml"), "w")))
+
+        def write(data: bytes) -> None:
+            for sink in sinks:
+                sink.write(data)
+
+        header = (
+            f"# Generated stack: {stack_name}\n"
+            "provider:\n"
+            "  name: openfaas\n"
+            f"  gateway: {gateway}\n"
+            "functions:\n"
+        )
+        write(header.encode())
+
+        # One encode and one write per function; the bindings JSON is already bytes
+        for index, info in enumerate(functions):
+            image = f"{prefix}/{info['faas_name']}:latest" if prefix else f"{info['faas_name']}:latest"
+            block = (
+                ("\n" if index else "")
+                + f"  {info['faas_name']}:\n"
+                + f"    lang: {info['faas_template']}\n"
+                + f"    handler: ./functions/{info['faas_name']}\n"
+                + f"    image: {image}\n"
+                + "    annotations:\n"
+                + f"      azure-path: '{info['relative_path']}'\n"
+                + "      azure-bindings: '"
+            )
+            write(block.encode() + _json_bytes(info["bindings"], indent=False) + b"'\n")
+
+
+def _utc_iso_now() -> str:
+    """Current UTC time as an ISO 8601 string with microseconds, e.g. 2024-01-31T12:00:00.123456Z."""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{nanos // 1000:06d}Z"
 
 
 def write_manifest(
@@ -359,9 +699,10 @@ def write_manifest(
     out_root: Path,
     source_label: str,
     gateway: str,
+    archive: zipfile.ZipFile | None = None,
 ) -> None:
     manifest = {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": _utc_iso_now(),
         "source": source_label,
         "gateway": gateway,
         "function_count": len(functions),
@@ -380,12 +721,15 @@ def write_manifest(
         ],
     }
 
-    (out_root / "function-manifest.json").write_text(
-        json.dumps(manifest, indent=2), encoding="utf-8"
-    )
+    _emit(out_root, "function-manifest.json", _json_bytes(manifest), archive)
 
 
-def write_root_readme(out_root: Path, stack_name: str, gateway: str) -> None:
+def write_root_readme(
+    out_root: Path,
+    stack_name: str,
+    gateway: str,
+    archive: zipfile.ZipFile | None = None,
+) -> None:
     readme = dedent(
         f"""
         # OpenFaaS Migration Bundle
@@ -412,25 +756,52 @@ def write_root_readme(out_root: Path, stack_name: str, gateway: str) -> None:
         5. Optionally, keep this bundle for traceability and share the zipped archive with operators.
         """
     )
-    (out_root / "README.md").write_text(readme.strip() + "\n", encoding="utf-8")
+    _emit(out_root, "README.md", (readme.strip() + "\n").encode(), archive)
+
+
+class _IsalZlib:
+    """zlib stand-in for zipfile that deflates with ISA-L at the levels it supports (0-3)."""
+
+    @staticmethod
+    def compressobj(level: int = zlib.Z_DEFAULT_COMPRESSION, *args, **kwargs):
+        if 0 <= level <= 3:
+            return isal_zlib.compressobj(level, *args, **kwargs)
+        return zlib.compressobj(level, *args, **kwargs)
 
+    def __getattr__(self, name: str):
+        return getattr(zlib, name)
 
-def bundle_to_zip(out_root: Path, zip_path: Path) -> None:
+
+@contextmanager
+def open_bundle_zip(zip_path: Path) -> Iterator[zipfile.ZipFile]:
     zip_path.parent.mkdir(parents=True, exist_ok=True)
     if zip_path.exists():
         zip_path.unlink()
 
     LOG.info("Creating zip archive %s", zip_path)
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        for item in out_root.rglob("*"):
-            archive.write(item, item.relative_to(out_root))
+    # zipfile builds its deflaters through its module-level zlib reference. Swapping only that
+    # reference, and only while this archive is open, leaves the real zlib module untouched.
+    original_zlib = zipfile.zlib
+    if isal_zlib is not None:
+        zipfile.zlib = _IsalZlib()
+        LOG.debug("Using ISA-L for zip compression")
+    try:
+        with zipfile.ZipFile(
+            zip_path,
+            "w",
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=ZIP_COMPRESSLEVEL,
+        ) as archive:
+            yield archive
+    finally:
+        zipfile.zlib = original_zlib
 
 
 def main() -> None:
     args = parse_args()
     log_level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
-    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    timestamp = time.strftime("%Y%m%d%H%M%S", time.gmtime())
 
     with tempfile.TemporaryDirectory() as temp_dir:
         work_dir = Path(temp_dir)
@@ -457,20 +828,6 @@ def main() -> None:
 
         output_root.mkdir(parents=True, exist_ok=False)
 
-        copy_functions(functions, source_root, output_root)
-
-        source_label = args.repo_url or (str(args.zip_path) if args.zip_path else str(args.repo_path))
-
-        write_stack_yaml(
-            functions,
-            output_root,
-            args.registry_prefix,
-            args.gateway,
-            args.stack_name,
-        )
-        write_manifest(functions, output_root, source_label, args.gateway)
-        write_root_readme(output_root, args.stack_name, args.gateway)
-
         output_zip = (
             args.output_zip.expanduser().resolve()
             if args.output_zip
@@ -479,7 +836,27 @@ def main() -> None:
         if output_zip == output_root:
             output_zip = output_root.parent / f"{output_root.name}.zip"
 
-        bundle_to_zip(output_root, output_zip)
+        source_label = args.repo_url or (str(args.zip_path) if args.zip_path else str(args.repo_path))
+
+        # The zip is filled while the bundle is written, so nothing is read back afterwards
+        with ExitStack() as stack:
+            archive = stack.enter_context(open_bundle_zip(output_zip))
+            source_zip = None
+            source_zip_root = "."
+            if args.zip_path:
+                source_zip = stack.enter_context(zipfile.ZipFile(args.zip_path, "r"))
+                source_zip_root = source_root.relative_to(work_dir).as_posix()
+            copy_functions(functions, source_root, output_root, archive, source_zip, source_zip_root)
+            write_stack_yaml(
+                functions,
+                output_root,
+                args.registry_prefix,
+                args.gateway,
+                args.stack_name,
+                archive,
+            )
+            write_manifest(functions, output_root, source_label, args.gateway, archive)
+            write_root_readme(output_root, args.stack_name, args.gateway, archive)
 
         LOG.info("Bundle ready at %s", output_root)
         LOG.info("Zipped export written to %s", output_zip)